@@ -11,19 +11,77 @@ Features:
 
 import argparse
 import asyncio
-import glob
+import json
 import logging
+import mmap
 import os
 import re
+import shutil
+import signal
 import subprocess
 import sys
 import tempfile
 import time
+from collections import defaultdict, deque
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, NamedTuple, Optional, Tuple
 
 
+# Matches a Go fuzz function declaration, capturing the function name
+_FUZZ_PATTERN = r'func\s+(Fuzz\w*)\s*\('
+_FUZZ_RE = re.compile(_FUZZ_PATTERN.encode('ascii'))
+
+# Directories never searched for fuzz tests (hidden directories are skipped too)
+_IGNORED_DIRS = frozenset({
+    'vendor',
+    'node_modules',
+    '.git',
+    '.github',
+    '.venv',
+    '.cache',
+    'testdata',
+})
+
+# Only the last _OUTPUT_TAIL_CHUNKS * _OUTPUT_CHUNK_SIZE bytes (64 KiB) of each
+# fuzz test's stdout/stderr are kept in memory
+_OUTPUT_CHUNK_SIZE = 4096
+_OUTPUT_TAIL_CHUNKS = 16
+
+
+async def _drain(stream: asyncio.StreamReader, tail: deque):
+    """Read a pipe to EOF, retaining only the most recent chunks in tail."""
+    while True:
+        chunk = await stream.read(_OUTPUT_CHUNK_SIZE)
+        if not chunk:
+            break
+        tail.append(chunk)
+
+
+async def _communicate_tail(process: asyncio.subprocess.Process,
+                            stdout_tail: deque, stderr_tail: deque) -> int:
+    """Drain both pipes of a process into bounded tails and wait for it to exit."""
+    await asyncio.gather(
+        _drain(process.stdout, stdout_tail),
+        _drain(process.stderr, stderr_tail)
+    )
+    return await process.wait()
+
+
+def _decode_tail(tail: deque) -> str:
+    """Decode the retained output chunks, tolerating split multi-byte characters."""
+    return b''.join(tail).decode('utf-8', errors='replace')
+
+
+def _iter_test_go(root: str = '.'):
+    """Yield Go test files under root, pruning ignored and hidden directories."""
+    for dirpath, dirs, files in os.walk(root, topdown=True):
+        dirs[:] = [d for d in dirs if d not in _IGNORED_DIRS and not d.startswith('.')]
+        for f in files:
+            if f.endswith('_test.go'):
+                yield os.path.join(dirpath, f)
+
+
 class FuzzTarget(NamedTuple):
     """Represents a single fuzz test target."""
     directory: str
@@ -40,6 +98,113 @@ class FuzzResult(NamedTuple):
     error: str
 
 
+def _make_target(test_file: str, func: str) -> FuzzTarget:
+    """Build a fuzz target from a test file path and function name."""
+    test_file = os.path.normpath(test_file)
+    parent_dir = os.path.dirname(test_file)
+    return FuzzTarget(
+        directory=parent_dir if parent_dir else ".",
+        function=func,
+        file_path=test_file
+    )
+
+
+def _scan_one(test_file: str) -> List[FuzzTarget]:
+    """Return the fuzz targets declared in a single test file."""
+    with open(test_file, 'rb') as f:
+        # mmap cannot map empty files
+        if os.fstat(f.fileno()).st_size == 0:
+            return []
+        
+        # Scan the page cache directly instead of copying the file into a bytes object
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            data = f.read()
+        
+        try:
+            # Single pass over the raw bytes; Go identifiers here are ASCII
+            funcs = _FUZZ_RE.findall(data)
+        finally:
+            if isinstance(data, mmap.mmap):
+                data.close()
+    
+    return [_make_target(test_file, func.decode('ascii')) for func in funcs]
+
+
+def _default_history_file() -> str:
+    """Return the default location of the fuzz history file."""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'dev-env-fuzz', 'history.json')
+
+
+class FuzzHistory:
+    """Per-target run history used to schedule likely failures first."""
+    
+    # Targets not run for this long get the full staleness boost
+    STALE_AFTER = 7 * 24 * 60 * 60
+    # Weight of the failure rate relative to the (at most 1.0) staleness term
+    FAILURE_WEIGHT = 2.0
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.entries: Dict[str, Dict[str, float]] = {}
+    
+    @staticmethod
+    def key(target: FuzzTarget) -> str:
+        """Identify a target across runs and projects."""
+        return f"{os.path.abspath(target.file_path)}::{target.function}"
+    
+    def load(self):
+        """Load history from disk, starting empty if it is missing or unreadable."""
+        try:
+            with open(self.path, 'r') as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            entries = {}
+        
+        self.entries = entries if isinstance(entries, dict) else {}
+    
+    def save(self):
+        """Atomically write history back to disk."""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        temp_fd, temp_path = tempfile.mkstemp(dir=directory or None, prefix='.history_')
+        try:
+            with os.fdopen(temp_fd, 'w') as f:
+                json.dump(self.entries, f)
+            os.replace(temp_path, self.path)
+        except Exception:
+            os.unlink(temp_path)
+            raise
+    
+    def priority(self, target: FuzzTarget, now: float) -> float:
+        """Score a target: weighted failure rate plus how long since it last ran.
+        
+        Failures carry twice the weight of staleness (which tops out at 1.0), so a
+        target failing more than half its runs is scheduled before any target that
+        has never failed, including never-run ones.
+        """
+        entry = self.entries.get(self.key(target), {})
+        runs = entry.get('runs', 0)
+        fails = entry.get('fails', 0)
+        last = entry.get('last', 0)
+        
+        failure_rate = fails / runs if runs else 0.0
+        staleness = min(1.0, (now - last) / self.STALE_AFTER)
+        return self.FAILURE_WEIGHT * failure_rate + staleness
+    
+    def record(self, result: FuzzResult):
+        """Record the outcome of a fuzz test run."""
+        entry = self.entries.setdefault(self.key(result.target), {'runs': 0, 'fails': 0, 'last': 0})
+        entry['runs'] = entry.get('runs', 0) + 1
+        if not result.success:
+            entry['fails'] = entry.get('fails', 0) + 1
+        entry['last'] = time.time()
+
+
 class FuzzConfig:
     """Configuration for fuzz testing."""
     
@@ -50,19 +215,24 @@ class FuzzConfig:
         self.continue_on_failure: bool = False
         self.verbose: bool = False
         self.config_dir: str = "./shared"
+        self.history_file: str = _default_history_file()
         
     @classmethod
     def from_env_and_args(cls) -> 'FuzzConfig':
         """Create config from environment variables and command line arguments."""
         config = cls()
         
-        # Load from environment variables
-        config.fuzz_time = int(os.environ.get('FUZZ_TIME', config.fuzz_time))
-        config.jobs = int(os.environ.get('FUZZ_JOBS', config.jobs)) if os.environ.get('FUZZ_JOBS') else config.jobs
-        config.error_file = os.environ.get('FUZZ_ERROR_FILE', config.error_file)
-        config.continue_on_failure = os.environ.get('FUZZ_CONTINUE_ON_FAILURE', '').lower() == 'true'
-        config.verbose = os.environ.get('FUZZ_VERBOSE', '').lower() == 'true'
-        config.config_dir = os.environ.get('FUZZ_CONFIG_DIR', config.config_dir)
+        # Load from environment variables, reading each one exactly once
+        env = os.environ
+        fuzz_time = env.get('FUZZ_TIME')
+        config.fuzz_time = int(fuzz_time) if fuzz_time else config.fuzz_time
+        fuzz_jobs = env.get('FUZZ_JOBS')
+        config.jobs = int(fuzz_jobs) if fuzz_jobs else config.jobs
+        config.error_file = env.get('FUZZ_ERROR_FILE', config.error_file)
+        config.continue_on_failure = env.get('FUZZ_CONTINUE_ON_FAILURE', '').lower() == 'true'
+        config.verbose = env.get('FUZZ_VERBOSE', '').lower() == 'true'
+        config.config_dir = env.get('FUZZ_CONFIG_DIR', config.config_dir)
+        config.history_file = env.get('FUZZ_HISTORY_FILE') or config.history_file
         
         # Parse command line arguments
         parser = argparse.ArgumentParser(
@@ -89,6 +259,7 @@ ENVIRONMENT VARIABLES:
     FUZZ_CONTINUE_ON_FAILURE   Continue on failures (true/false)
     FUZZ_VERBOSE               Enable verbose output (true/false)
     FUZZ_CONFIG_DIR            Configuration directory
+    FUZZ_HISTORY_FILE          Run history used to order fuzz tests
             """
         )
         
@@ -104,6 +275,8 @@ ENVIRONMENT VARIABLES:
                           help='Enable verbose output with detailed execution info')
         parser.add_argument('--config-dir', metavar='DIR',
                           help=f'Configuration directory (default: {config.config_dir})')
+        parser.add_argument('--history-file', metavar='FILE',
+                          help=f'Run history used to order fuzz tests (default: {config.history_file})')
         
         args = parser.parse_args()
         
@@ -120,6 +293,8 @@ ENVIRONMENT VARIABLES:
             config.verbose = True
         if args.config_dir is not None:
             config.config_dir = args.config_dir
+        if args.history_file is not None:
+            config.history_file = args.history_file
             
         return config
 
@@ -127,12 +302,37 @@ ENVIRONMENT VARIABLES:
 class FuzzRunner:
     """Main fuzz test runner with parallel execution."""
     
+    # Location of ripgrep, probed once and shared by all runners
+    _ripgrep_path: Optional[str] = None
+    _ripgrep_probed: bool = False
+    
     def __init__(self, config: FuzzConfig):
         self.config = config
         self.logger = self._setup_logging()
         self.cpu_cores = os.cpu_count() or 4
         self.jobs = self._determine_jobs()
+        # Split the cores between parallel jobs; fixed for the whole run
+        self._gomaxprocs = max(1, self.cpu_cores // self.jobs)
+        # The project root and whether it is a Go module do not change during a run
+        self._cwd = os.getcwd()
+        self._is_go_module = os.path.exists("go.mod")
+        # Environment shared by every Go subprocess, built once
+        self._go_env = {**os.environ, 'GOMAXPROCS': str(self._gomaxprocs)}
         self.error_file_handle = None
+        self.history = FuzzHistory(config.history_file)
+        # Shared for the runner's lifetime; file reads release the GIL, so
+        # threads overlap I/O latency when scanning test files
+        self._pool = ThreadPoolExecutor(max_workers=min(32, self.cpu_cores * 4))
+        self._fuzz_cache_dir = ""
+        # Compiled package test binaries, shared by every fuzz target in a package
+        self._build_dir: Optional[str] = None
+        self._pkg_bins: Dict[str, Tuple[Optional[str], str]] = {}
+        self._compile_locks: Dict[str, asyncio.Lock] = {}
+        self._pkg_indexes: Dict[str, int] = {}
+        # Per-package fuzz corpus cache directories, as `go test` would pass them
+        self._pkg_fuzz_dirs: Dict[str, str] = {}
+        # Running children mapped to their pidfd (None where unsupported)
+        self._live: Dict[asyncio.subprocess.Process, Optional[int]] = {}
         
         if config.error_file:
             error_file_path = os.path.abspath(config.error_file)
@@ -144,6 +344,9 @@ class FuzzRunner:
         return self
         
     def __exit__(self, exc_type, exc_val, exc_tb):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        if self._build_dir:
+            shutil.rmtree(self._build_dir, ignore_errors=True)
         if self.error_file_handle:
             self.error_file_handle.close()
     
@@ -189,122 +392,345 @@ class FuzzRunner:
         else:
             self.logger.debug("No error file handle available")
     
+    @classmethod
+    def _find_ripgrep(cls) -> Optional[str]:
+        """Locate the ripgrep binary, caching the result on the class."""
+        if not cls._ripgrep_probed:
+            cls._ripgrep_path = shutil.which('rg')
+            cls._ripgrep_probed = True
+        return cls._ripgrep_path
+    
+    def _discover_with_ripgrep(self) -> Optional[List[FuzzTarget]]:
+        """Discover fuzz functions with a single ripgrep invocation.
+        
+        Returns None if ripgrep is unavailable or fails so the caller can fall back.
+        """
+        rg = self._find_ripgrep()
+        if not rg:
+            return None
+        
+        cmd = [
+            # --no-ignore: find the same files as the Python walk, which ignores .gitignore
+            rg, '--no-config', '--no-ignore', '--null', '-o', '-N', '-H',
+            '-e', _FUZZ_PATTERN,
+            '-g', '*_test.go',
+            *(arg for d in sorted(_IGNORED_DIRS) for arg in ('-g', f'!{d}/')),
+            '--replace', '$1',
+            '.'
+        ]
+        
+        try:
+            # Bytes mode: paths need not be valid UTF-8
+            result = subprocess.run(cmd, capture_output=True, check=False)
+        except (FileNotFoundError, PermissionError) as e:
+            self.logger.debug(f"ripgrep unavailable: {e}")
+            return None
+        
+        # ripgrep exits 1 when nothing matched and 2 on errors
+        if result.returncode not in (0, 1):
+            self.logger.debug(f"ripgrep failed: {result.stderr.decode(errors='replace').strip()}")
+            return None
+        
+        targets = []
+        # Decode like os.walk does so undecodable paths still round-trip
+        for line in os.fsdecode(result.stdout).split('\n'):
+            path, sep, func = line.partition('\0')
+            if not sep or not func:
+                continue
+            targets.append(_make_target(path, func))
+        
+        return targets
+    
+    def _discover_with_git_grep(self) -> Optional[List[FuzzTarget]]:
+        """Discover fuzz functions with a single git grep invocation.
+        
+        Returns None if git is unavailable or this is not a git work tree.
+        """
+        cmd = [
+            # Search untracked and gitignored files too, like the Python walk
+            'git', 'grep', '--untracked', '--no-exclude-standard', '-I', '-z', '-o', '--perl-regexp',
+            '-e', _FUZZ_PATTERN,
+            '--', '*_test.go',
+            ':(exclude,glob)**/.*/**',
+            *(f':(exclude,glob)**/{d}/**' for d in sorted(_IGNORED_DIRS))
+        ]
+        
+        try:
+            # Bytes mode: paths need not be valid UTF-8
+            result = subprocess.run(cmd, capture_output=True, check=False)
+        except (FileNotFoundError, PermissionError) as e:
+            self.logger.debug(f"git grep unavailable: {e}")
+            return None
+        
+        # git grep exits 1 when nothing matched; anything else is an error
+        if result.returncode not in (0, 1):
+            self.logger.debug(f"git grep failed: {result.stderr.decode(errors='replace').strip()}")
+            return None
+        
+        func_re = re.compile(_FUZZ_PATTERN)
+        targets = []
+        # Decode like os.walk does so undecodable paths still round-trip
+        for line in os.fsdecode(result.stdout).split('\n'):
+            path, sep, match = line.partition('\0')
+            found = func_re.match(match) if sep else None
+            if found:
+                targets.append(_make_target(path, found.group(1)))
+        
+        return targets
+    
     def discover_fuzz_targets(self) -> List[FuzzTarget]:
         """Discover all fuzz test functions in the current directory and subdirectories."""
         self.logger.debug("Searching for fuzz test files...")
         
-        # Find all Go test files containing fuzz functions
-        fuzz_files = []
-        for test_file in glob.glob("**/*_test.go", recursive=True):
-            try:
-                with open(test_file, 'r') as f:
-                    content = f.read()
-                    if re.search(r'func\s+Fuzz\w*\s*\(', content):
-                        fuzz_files.append(test_file)
-            except Exception as e:
-                self.logger.warning(f"Could not read {test_file}: {e}")
+        # Prefer a single external search process over scanning files in Python
+        targets = None
+        for name, search in (("ripgrep", self._discover_with_ripgrep),
+                             ("git grep", self._discover_with_git_grep),
+                             ("python", self._discover_with_python)):
+            targets = search()
+            if targets is not None:
+                self.logger.debug(f"Discovered fuzz functions using {name}")
+                break
         
-        if not fuzz_files:
+        if not targets:
             self.logger.info("No fuzz test files found")
             return []
         
-        self.logger.debug(f"Found {len(fuzz_files)} fuzz test files")
+        # Parallel searchers emit files in arbitrary order
+        targets.sort(key=lambda t: t.file_path)
+        self.logger.debug(f"Found {len({t.file_path for t in targets})} fuzz test files")
+        
+        for i, target in enumerate(targets):
+            # Only show first few targets unless verbose
+            if self.config.verbose or i < 5:
+                self.logger.debug(f"Found fuzz function: {target.function} in {target.file_path}")
         
-        # Extract fuzz functions from each file
+        return targets
+    
+    def _discover_with_python(self) -> List[FuzzTarget]:
+        """Discover fuzz functions by reading each test file in Python."""
         targets = []
-        for test_file in fuzz_files:
+        future_to_file = {
+            self._pool.submit(_scan_one, test_file): test_file
+            for test_file in _iter_test_go('.')
+        }
+        
+        for future in as_completed(future_to_file):
+            test_file = future_to_file[future]
             try:
-                with open(test_file, 'r') as f:
-                    content = f.read()
-                    
-                # Find all fuzz function names
-                fuzz_funcs = re.findall(r'func\s+(Fuzz\w*)\s*\(', content)
-                parent_dir = os.path.dirname(test_file)
-                
-                for func in fuzz_funcs:
-                    target = FuzzTarget(
-                        directory=parent_dir if parent_dir else ".",
-                        function=func,
-                        file_path=test_file
-                    )
-                    targets.append(target)
-                    
-                    # Only show first few targets unless verbose
-                    if self.config.verbose or len(targets) <= 5:
-                        self.logger.debug(f"Found fuzz function: {func} in {test_file}")
-                        
-            except Exception as e:
-                self.logger.warning(f"Could not parse {test_file}: {e}")
+                targets.extend(future.result())
+            except OSError as e:
+                self.logger.warning(f"Could not read {test_file}: {e}")
         
         return targets
     
-    def _run_single_fuzz_test(self, target: FuzzTarget) -> FuzzResult:
-        """Run a single fuzz test."""
-        start_time = time.time()
+    async def _go_fuzz_cache_dir(self) -> str:
+        """Return the fuzz corpus cache directory `go test` would use."""
+        gocache = ""
+        try:
+            process = await asyncio.create_subprocess_exec(
+                'go', 'env', 'GOCACHE',
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+            stdout, _ = await process.communicate()
+            if process.returncode == 0:
+                gocache = stdout.decode().strip()
+        except Exception as e:
+            self.logger.debug(f"Could not determine GOCACHE: {e}")
         
-        # Calculate GOMAXPROCS for this test
-        gomaxprocs = max(1, self.cpu_cores // self.jobs)
+        if not gocache or gocache == "off":
+            gocache = os.path.join(tempfile.gettempdir(), "go-build")
         
-        self.logger.debug(f"Starting fuzz test: {target.function} in {target.file_path}")
-        self.logger.debug(f"Running with GOMAXPROCS={gomaxprocs}")
-        self.logger.debug(f"Working directory: {os.getcwd()}")
+        return os.path.join(gocache, "fuzz")
+    
+    async def _build_test_binary(self, directory: str, output_path: str) -> Tuple[bool, str]:
+        """Compile the instrumented test binary for a package with `go test -c`."""
+        # -fuzz enables coverage instrumentation in the compiled binary
+        cmd = ['go', 'test', '-c', '-fuzz=.', '-o', output_path, self._module_path(directory)]
+        
+        self.logger.debug(f"Compiling fuzz tests in {directory}")
+        self.logger.debug(f"Command: {' '.join(cmd)}")
+        
+        # Bounded like a whole `go test` run was before compiling separately
+        timeout = self.config.fuzz_time + 60
+        returncode, stdout, stderr = await self._run_go(cmd, timeout)
+        
+        if returncode is None:
+            return False, f"Compiling fuzz tests in {directory} timed out after {timeout}s"
         
-        # Prepare environment
-        env = os.environ.copy()
-        env['GOMAXPROCS'] = str(gomaxprocs)
+        if returncode != 0:
+            return False, (stderr or stdout).decode('utf-8', errors='replace')
         
-        # Build command - use module-relative path for Go modules
+        return True, ""
+    
+    async def _import_path(self, directory: str) -> Tuple[Optional[str], str]:
+        """Resolve a package's import path, returning it or an error message."""
+        cmd = ['go', 'list', '-f', '{{.ImportPath}}', self._module_path(directory)]
+        timeout = self.config.fuzz_time + 60
+        returncode, stdout, stderr = await self._run_go(cmd, timeout)
+        
+        if returncode is None:
+            return None, f"Resolving the import path of {directory} timed out after {timeout}s"
+        
+        import_path = stdout.decode('utf-8', errors='replace').strip()
+        if returncode != 0 or not import_path:
+            return None, (stderr or stdout).decode('utf-8', errors='replace')
+        
+        return import_path, ""
+    
+    def _module_path(self, directory: str) -> str:
+        """Return the package argument go commands should use for a directory."""
+        # Use module-relative path for Go modules
         # Check if we're in a Go module by looking for go.mod
-        module_path = target.directory
-        if os.path.exists("go.mod"):
+        if self._is_go_module:
             # In a Go module, use relative paths with ./ prefix
-            if target.directory == ".":
-                module_path = "."
-            else:
-                module_path = f"./{target.directory}"
-        else:
-            # Not in a Go module, use absolute directory paths
-            module_path = target.directory
+            if directory == ".":
+                return "."
+            return f"./{directory}"
+        
+        # Not in a Go module, use absolute directory paths
+        return directory
+    
+    async def _run_go(self, cmd: List[str], timeout: float) -> Tuple[Optional[int], bytes, bytes]:
+        """Run a go command from the project root, killing it if it exceeds timeout.
+        
+        Returns the exit code (None on timeout) with the captured stdout and stderr.
+        """
+        process = await self._spawn(
+            *cmd,
+            env=self._go_env,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=self._cwd  # Ensure we're in the project root
+        )
+        
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+        except asyncio.TimeoutError:
+            await self._kill(process)
+            return None, b"", b""
+        except asyncio.CancelledError:
+            await self._kill(process)
+            raise
+        finally:
+            self._release(process)
+        
+        return process.returncode, stdout, stderr
+    
+    async def _spawn(self, *cmd: str, **kwargs) -> asyncio.subprocess.Process:
+        """Start a child in its own session and track it until released."""
+        # Fuzz workers and compiler children share the session's process group
+        process = await asyncio.create_subprocess_exec(*cmd, start_new_session=True, **kwargs)
+        
+        # On Linux, a pidfd pins this exact process so it can be signalled
+        # without racing against PID reuse once it has been reaped
+        pidfd = None
+        if hasattr(os, 'pidfd_open'):
+            try:
+                pidfd = os.pidfd_open(process.pid)
+            except OSError:
+                pidfd = None
+        
+        self._live[process] = pidfd
+        return process
+    
+    def _release(self, process: asyncio.subprocess.Process):
+        """Stop tracking a child and close its pidfd."""
+        pidfd = self._live.pop(process, None)
+        if pidfd is not None:
+            os.close(pidfd)
+    
+    def _signal_kill(self, process: asyncio.subprocess.Process):
+        """Send SIGKILL to a tracked child and the rest of its process group."""
+        if process.returncode is not None:
+            return
+        
+        pidfd = self._live.get(process)
+        if pidfd is not None:
+            try:
+                signal.pidfd_send_signal(pidfd, signal.SIGKILL)
+            except ProcessLookupError:
+                # The child already exited, so its group id may be reused
+                return
+        
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+    
+    async def _kill(self, process: asyncio.subprocess.Process):
+        """Kill a child process and its descendants if still running, and reap it."""
+        self._signal_kill(process)
+        await process.wait()
+    
+    def _kill_all(self):
+        """Kill every running child so in-flight fuzz tests stop immediately."""
+        for process in list(self._live):
+            self._signal_kill(process)
+    
+    async def _run_single_fuzz_test(self, target: FuzzTarget, test_binary: str) -> FuzzResult:
+        """Run a single fuzz test using a precompiled package test binary."""
+        start_time = time.time()
+        
+        self.logger.debug(f"Starting fuzz test: {target.function} in {target.file_path}")
+        self.logger.debug(f"Running with GOMAXPROCS={self._gomaxprocs}")
+        package_dir = os.path.normpath(os.path.join(self._cwd, target.directory))
+        self.logger.debug(f"Working directory: {package_dir}")
         
         cmd = [
-            'go', 'test', module_path,
-            f'-run=^{target.function}$',
-            f'-fuzz=^{target.function}$',
-            f'-fuzztime={self.config.fuzz_time}s'
+            test_binary,
+            f'-test.run=^{target.function}$',
+            f'-test.fuzz=^{target.function}$',
+            f'-test.fuzztime={self.config.fuzz_time}s',
+            f'-test.fuzzcachedir={self._pkg_fuzz_dirs[target.directory]}'
         ]
         
         self.logger.debug(f"Command: {' '.join(cmd)}")
         
+        process = None
         try:
-            # Run the test from project root
-            result = subprocess.run(
-                cmd,
-                env=env,
-                capture_output=True,
-                text=True,
-                cwd=os.getcwd(),  # Ensure we're in the project root
+            # Test binaries run from their package directory, as under `go test`
+            process = await self._spawn(
+                *cmd,
+                env=self._go_env,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=package_dir
+            )
+            
+            # Drain both pipes concurrently, keeping only the tail of each
+            stdout_tail: deque = deque(maxlen=_OUTPUT_TAIL_CHUNKS)
+            stderr_tail: deque = deque(maxlen=_OUTPUT_TAIL_CHUNKS)
+            returncode = await asyncio.wait_for(
+                _communicate_tail(process, stdout_tail, stderr_tail),
                 timeout=self.config.fuzz_time + 60  # Add buffer for test overhead
             )
             
+            output = _decode_tail(stdout_tail)
+            error = _decode_tail(stderr_tail)
+            
             duration = time.time() - start_time
-            success = result.returncode == 0
+            success = returncode == 0
             
             if success:
                 self.logger.debug(f"Completed fuzz test: {target.function} in {target.file_path}")
             else:
                 self._log_error(f"Failed fuzz test: {target.function} in {target.file_path}")
-                if result.stderr:
-                    self._log_error(f"Error output: {result.stderr}")
+                if error:
+                    self._log_error(f"Error output: {error}")
             
             return FuzzResult(
                 target=target,
                 success=success,
                 duration=duration,
-                output=result.stdout,
-                error=result.stderr
+                output=output,
+                error=error
             )
             
-        except subprocess.TimeoutExpired:
+        except asyncio.TimeoutError:
+            await self._kill(process)
+            
             duration = time.time() - start_time
             error_msg = f"Fuzz test {target.function} timed out after {duration:.1f}s"
             self._log_error(error_msg)
@@ -317,7 +743,16 @@ class FuzzRunner:
                 error=error_msg
             )
             
+        except asyncio.CancelledError:
+            # Cancelling the task does not stop the child, so kill it explicitly
+            if process is not None:
+                await self._kill(process)
+            raise
+            
         except Exception as e:
+            if process is not None:
+                await self._kill(process)
+            
             duration = time.time() - start_time
             error_msg = f"Exception running fuzz test {target.function}: {e}"
             self._log_error(error_msg)
@@ -329,16 +764,77 @@ class FuzzRunner:
                 output="",
                 error=error_msg
             )
+            
+        finally:
+            if process is not None:
+                self._release(process)
+    
+    async def _compile_package(self, directory: str) -> Tuple[Optional[str], str]:
+        """Return the package's test binary and compile error, compiling it on first use."""
+        async with self._compile_locks[directory]:
+            if directory not in self._pkg_bins:
+                if self._build_dir is None:
+                    self._build_dir = tempfile.mkdtemp(prefix='fuzz_')
+                output_path = os.path.join(self._build_dir, f"pkg{self._pkg_indexes[directory]}.test")
+                
+                try:
+                    compiled, compile_error = await self._build_test_binary(directory, output_path)
+                    if compiled:
+                        # go test keys the fuzz corpus cache by import path
+                        import_path, compile_error = await self._import_path(directory)
+                        compiled = import_path is not None
+                        if compiled:
+                            self._pkg_fuzz_dirs[directory] = os.path.join(self._fuzz_cache_dir, import_path)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    compiled, compile_error = False, str(e)
+                
+                if not compiled:
+                    self._log_error(f"Failed to compile fuzz tests in {directory}")
+                    if compile_error:
+                        self._log_error(f"Error output: {compile_error}")
+                
+                self._pkg_bins[directory] = (output_path if compiled else None, compile_error)
+        
+        return self._pkg_bins[directory]
     
-    def run_fuzz_tests(self, targets: List[FuzzTarget]) -> Dict[str, int]:
+    async def _run_fuzz_target(self, target: FuzzTarget, semaphore: asyncio.Semaphore) -> FuzzResult:
+        """Run one fuzz target against its package's shared test binary."""
+        async with semaphore:
+            start_time = time.time()
+            test_binary, compile_error = await self._compile_package(target.directory)
+            
+            if test_binary is None:
+                return FuzzResult(
+                    target=target,
+                    success=False,
+                    duration=time.time() - start_time,
+                    output="",
+                    error=compile_error
+                )
+            
+            return await self._run_single_fuzz_test(target, test_binary)
+    
+    async def run_fuzz_tests(self, targets: List[FuzzTarget]) -> Dict[str, int]:
         """Run all fuzz tests with parallel execution."""
         if not targets:
             self.logger.info("No fuzz functions found")
             return {"completed": 0, "failed": 0}
         
-        self.logger.info(f"Found {len(targets)} fuzz functions to test")
+        # Run previously failing and long-unrun targets first
+        self.history.load()
+        now = time.time()
+        ordered = sorted(targets, key=lambda t: self.history.priority(t, now), reverse=True)
+        
+        for i, target in enumerate(ordered):
+            if self.config.verbose or i < 5:
+                self.logger.debug(f"Priority {self.history.priority(target, now):.2f}: {target.function} in {target.file_path}")
+        
+        packages = {target.directory for target in targets}
+        self.logger.info(f"Found {len(targets)} fuzz functions in {len(packages)} packages to test")
         self.logger.info(f"Running with {self.jobs} parallel jobs, {self.config.fuzz_time}s per test")
-        self.logger.info(f"Each fuzz test will use up to {max(1, self.cpu_cores // self.jobs)} CPU cores (GOMAXPROCS)")
+        self.logger.info(f"Each fuzz test will use up to {self._gomaxprocs} CPU cores (GOMAXPROCS)")
         
         if len(targets) > 50:
             self.logger.info("Large number of fuzz tests detected - this may take a while")
@@ -348,22 +844,44 @@ class FuzzRunner:
         completed = 0
         failed = 0
         
-        # Use ThreadPoolExecutor for parallel execution
-        with ThreadPoolExecutor(max_workers=self.jobs) as executor:
-            # Submit all fuzz tests
-            future_to_target = {
-                executor.submit(self._run_single_fuzz_test, target): target 
-                for target in targets
-            }
+        self._fuzz_cache_dir = await self._go_fuzz_cache_dir()
+        
+        # Compile each package at most once per run; Go's build cache keeps
+        # recompiling unchanged packages cheap on later runs
+        self._pkg_bins = {}
+        self._pkg_fuzz_dirs = {}
+        # Binary names are fixed up front so concurrent compiles never share a path
+        self._pkg_indexes = {directory: i for i, directory in enumerate(sorted(packages))}
+        self._compile_locks = defaultdict(asyncio.Lock)
+        
+        # The semaphore bounds how many fuzz tests run at once; tasks are
+        # created in priority order and acquire it in that order
+        semaphore = asyncio.Semaphore(self.jobs)
+        task_to_target = {
+            asyncio.ensure_future(self._run_fuzz_target(target, semaphore)): target
+            for target in ordered
+        }
+        
+        try:
+            pending = set(task_to_target)
             
             # Process completed tests as they finish
-            for future in as_completed(future_to_target):
-                target = future_to_target[future]
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
                 
-                try:
-                    result = future.result()
+                for task in done:
+                    target = task_to_target[task]
                     completed += 1
                     
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        self.logger.error(f"Exception processing result for {target.function}: {e}")
+                        failed += 1
+                        continue
+                    
+                    self.history.record(result)
+                    
                     if not result.success:
                         failed += 1
                         
@@ -377,35 +895,37 @@ class FuzzRunner:
                         # Show error details for debugging
                         if result.error:
                             self.logger.debug(f"Error details for {result.target.function}: {result.error[:200]}...")
-                        
-                        # Stop on first failure if not continuing
-                        if not self.config.continue_on_failure:
-                            self.logger.error("Stopping due to failure (use -c to continue on failures)")
-                            # Cancel remaining futures
-                            for remaining_future in future_to_target:
-                                if not remaining_future.done():
-                                    remaining_future.cancel()
-                            break
                     
                     # Progress update
                     remaining = len(targets) - completed
                     self.logger.info(f"Progress: {completed}/{len(targets)} completed, {failed} failed, {remaining} remaining")
-                    
-                except Exception as e:
-                    self.logger.error(f"Exception processing result for {target.function}: {e}")
-                    completed += 1
-                    failed += 1
+                
+                # Stop on first failure if not continuing
+                if failed and not self.config.continue_on_failure:
+                    self.logger.error("Stopping due to failure (use -c to continue on failures)")
+                    self._kill_all()
+                    break
+        finally:
+            # Cancel remaining tests; running ones are killed
+            for task in task_to_target:
+                task.cancel()
+            await asyncio.gather(*task_to_target, return_exceptions=True)
+            
+            try:
+                self.history.save()
+            except Exception as e:
+                self.logger.warning(f"Could not save fuzz history to {self.history.path}: {e}")
         
         return {"completed": completed, "failed": failed}
     
-    def run(self) -> int:
+    async def run(self) -> int:
         """Main entry point for fuzz testing."""
         try:
             # Discover fuzz targets
             targets = self.discover_fuzz_targets()
             
             # Run fuzz tests
-            stats = self.run_fuzz_tests(targets)
+            stats = await self.run_fuzz_tests(targets)
             
             # Final summary
             self.logger.info(f"Fuzzing completed: {stats['completed']} total, {stats['failed']} failed")
@@ -425,9 +945,6 @@ class FuzzRunner:
             self.logger.info("All fuzz tests completed successfully")
             return 0
             
-        except KeyboardInterrupt:
-            self.logger.info("Fuzz testing interrupted by user")
-            return 130
         except Exception as e:
             self.logger.error(f"Unexpected error: {e}")
             return 1
@@ -438,7 +955,11 @@ def main():
     config = FuzzConfig.from_env_and_args()
     
     with FuzzRunner(config) as runner:
-        exit_code = runner.run()
+        try:
+            exit_code = asyncio.run(runner.run())
+        except KeyboardInterrupt:
+            runner.logger.info("Fuzz testing interrupted by user")
+            exit_code = 130
         sys.exit(exit_code)
 
 
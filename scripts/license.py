@@ -6,10 +6,13 @@ Automatically discovers supported source files and adds appropriate license head
 Handles missing LICENSE and LICENSE_HEADER files gracefully.
 """
 
+import functools
 import os
+import re
 import sys
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # Define lists of supported file types and directories to ignore
@@ -44,72 +47,128 @@ ignored_dirs = [
     ".cache",
 ]
 
+# Set views of the lists above for O(1) lookups in the traversal loops
+SUPPORTED = frozenset(supported)
+IGNORED = frozenset(ignored_dirs)
+
+
+# addlicense only inspects the start of a file for an existing license and
+# treats any of these (case-insensitive) markers as one
+LICENSE_SCAN_BYTES = 1000
+LICENSE_MARKERS = (b"copyright", b"mozilla public", b"spdx-license-identifier")
+
+# Prefix Go's log package adds to addlicense error lines
+LOG_TIMESTAMP = re.compile(r'^\d{4}/\d{2}/\d{2} \d{2}:\d{2}:\d{2}(\.\d+)? ')
+
+# Number of files passed to a single addlicense invocation (keeps argv well under ARG_MAX)
+ADDLICENSE_BATCH_SIZE = 500
+
 
 # Function to check if a file should be ignored based on its path
-def is_file_in_ignored_dir(file_path, ignored_dirs):
-    return any(ignored_dir in file_path for ignored_dir in ignored_dirs)
+def is_file_in_ignored_dir(file_path, ignored=IGNORED):
+    return any(part in ignored for part in file_path.split(os.sep))
 
 
-def find_license_header():
-    """Find LICENSE_HEADER file using multiple search strategies."""
+def has_license_header(file_path):
+    """Check whether a file already carries a license header, as addlicense would."""
+    with open(file_path, 'rb') as f:
+        head = f.read(LICENSE_SCAN_BYTES).lower()
+    return any(marker in head for marker in LICENSE_MARKERS)
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_repo_root():
+    """Return the git repository root, running git at most once."""
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--show-toplevel'], text=True, stderr=subprocess.DEVNULL
+        ).strip()
+    except Exception:
+        return None
+
+
+def _chunks(seq, n):
+    """Yield successive slices of at most n items from seq."""
+    for i in range(0, len(seq), n):
+        yield seq[i:i + n]
+
+
+def _failed_files(stderr, files):
+    """Map files named in addlicense error lines ("<path>: <error>") to their error."""
+    wanted = set(files)
+    failures = {}
+    for line in stderr.splitlines():
+        # Drop the standard log timestamp; paths may contain spaces or ': '
+        line = LOG_TIMESTAMP.sub('', line, count=1)
+        start = 0
+        while True:
+            sep = line.find(': ', start)
+            if sep < 0:
+                break
+            if line[:sep] in wanted:
+                failures[line[:sep]] = line[sep + 2:].strip()
+                break
+            start = sep + 1
+    return failures
+
+
+def apply_license(files, header_path):
+    """Run addlicense over a batch of files, returning a map of failed files to errors."""
+    # Run addlicense with appropriate options
+    cmd = ['addlicense', '-f', header_path, '-v', *files]
+    result = subprocess.run(cmd, capture_output=True, text=True, check=False)
+    if result.returncode == 0:
+        return {}
+
+    failures = _failed_files(result.stderr, files)
+    if not failures:
+        # Could not attribute the error to a file, so fail the whole batch
+        failures = {file_path: result.stderr.strip() for file_path in files}
+    return failures
+
+
+@functools.lru_cache(maxsize=None)
+def _find_first_existing(env_var, names):
+    """Find the first existing file from an env var, the current directory, or the repo root."""
     # Check environment variable first
-    env_path = os.getenv('LICENSE_HEADER_PATH')
+    env_path = os.getenv(env_var)
     if env_path and os.path.exists(env_path):
         return env_path
-    
+
     # Search in current directory
-    candidates = ['./LICENSE_HEADER', './LICENSE.header', './license.header']
-    for candidate in candidates:
+    for name in names:
+        candidate = f"./{name}"
         if os.path.exists(candidate):
             return candidate
-    
+
     # Search in git repository root
-    try:
-        repo_root = subprocess.check_output(['git', 'rev-parse', '--show-toplevel'], text=True).strip()
-        for candidate in ['LICENSE_HEADER', 'LICENSE.header', 'license.header']:
-            path = os.path.join(repo_root, candidate)
+    repo_root = _cached_repo_root()
+    if repo_root:
+        for name in names:
+            path = os.path.join(repo_root, name)
             if os.path.exists(path):
                 return path
-    except Exception:
-        pass
-    
+
     return None
 
 
+def find_license_header():
+    """Find LICENSE_HEADER file using multiple search strategies."""
+    return _find_first_existing('LICENSE_HEADER_PATH', ('LICENSE_HEADER', 'LICENSE.header', 'license.header'))
+
+
 def find_license_file():
     """Find LICENSE file using multiple search strategies."""
-    # Check environment variable first
-    env_path = os.getenv('LICENSE_FILE_PATH')
-    if env_path and os.path.exists(env_path):
-        return env_path
-    
-    # Search in current directory
-    candidates = ['./LICENSE', './LICENSE.txt', './license', './license.txt']
-    for candidate in candidates:
-        if os.path.exists(candidate):
-            return candidate
-    
-    # Search in git repository root
-    try:
-        repo_root = subprocess.check_output(['git', 'rev-parse', '--show-toplevel'], text=True).strip()
-        for candidate in ['LICENSE', 'LICENSE.txt', 'license', 'license.txt']:
-            path = os.path.join(repo_root, candidate)
-            if os.path.exists(path):
-                return path
-    except Exception:
-        pass
-    
-    return None
+    return _find_first_existing('LICENSE_FILE_PATH', ('LICENSE', 'LICENSE.txt', 'license', 'license.txt'))
 
 
 def create_default_header():
     """Create a default license header when none is found."""
     # Get project name from git or directory
-    project_name = "this project"
-    try:
-        repo_root = subprocess.check_output(['git', 'rev-parse', '--show-toplevel'], text=True).strip()
+    repo_root = _cached_repo_root()
+    if repo_root:
         project_name = os.path.basename(repo_root)
-    except Exception:
+    else:
         project_name = os.path.basename(os.getcwd())
     
     # Get current year
@@ -183,13 +242,13 @@ else:
     for root, dirs, files in os.walk('.', topdown=True):
         # skip ignored directories
         # respect .gitignore and skip hidden directories
-        dirs[:] = [d for d in dirs if d not in ignored_dirs and not d.startswith('.')]
+        dirs[:] = [d for d in dirs if d not in IGNORED and not d.startswith('.')]
         for f in files:
             # skip hidden files
             if f.startswith('.'):
                 continue
-            ext = os.path.splitext(f)[1].lstrip('.')
-            if ext in supported:
+            _, dot, ext = f.rpartition('.')
+            if dot and ext in SUPPORTED:
                 target_files.append(os.path.join(root, f))
 
 # Track statistics
@@ -197,20 +256,37 @@ processed_count = 0
 success_count = 0
 error_count = 0
 temp_headers = []  # Track temporary header files for cleanup
+files_to_process = []  # Files passed to addlicense in batches
 
 print(f"Found {len(target_files)} files to process")
 
+# Find header and license files once with multiple fallback strategies
+header_path = find_license_header()
+license_path = find_license_file()
+
+if not header_path:
+    print(f"Warning: No LICENSE_HEADER found, creating default header")
+    try:
+        header_path = create_default_header()
+        temp_headers.append(header_path)  # Track for cleanup
+    except Exception as e:
+        print(f"✗ Failed to create default header: {e}")
+        sys.exit(1)
+
+if not license_path:
+    print(f"Info: No LICENSE file found, proceeding with header-only")
+
 # Iterate over target files
 for file_path in target_files:
     # Extract the file extension
-    extension = os.path.splitext(file_path)[1].lstrip(".")
+    _, dot, extension = file_path.rpartition(".")
 
     # Check if the extension is supported
-    if extension not in supported:
+    if not dot or extension not in SUPPORTED:
         continue
 
     # Check if the file is in an ignored directory
-    if is_file_in_ignored_dir(file_path, ignored_dirs) or '/.' in file_path:
+    if is_file_in_ignored_dir(file_path) or '/.' in file_path:
         continue
 
     # Skip hidden files
@@ -220,40 +296,46 @@ for file_path in target_files:
 
     processed_count += 1
     print(f"Processing {file_path}")
-    
-    # Find header and license files with multiple fallback strategies
-    header_path = find_license_header()
-    license_path = find_license_file()
-    
-    if not header_path:
-        print(f"Warning: No LICENSE_HEADER found, creating default header")
+
+    # Fast path: addlicense would leave an already licensed file untouched
+    try:
+        if has_license_header(file_path):
+            print(f"✓ License header already present in {file_path}")
+            success_count += 1
+            continue
+    except OSError:
+        pass  # Let addlicense report unreadable files
+
+    files_to_process.append(file_path)
+
+# Run addlicense over many files per invocation to amortize its startup cost,
+# splitting the work so every core gets a batch
+workers = os.cpu_count() or 4
+batch_size = max(1, min(ADDLICENSE_BATCH_SIZE, -(-len(files_to_process) // workers)))
+
+with ThreadPoolExecutor(max_workers=workers) as executor:
+    future_to_chunk = {
+        executor.submit(apply_license, chunk, header_path): chunk
+        for chunk in _chunks(files_to_process, batch_size)
+    }
+
+    for future in as_completed(future_to_chunk):
+        chunk = future_to_chunk[future]
         try:
-            header_path = create_default_header()
-            temp_headers.append(header_path)  # Track for cleanup
+            failures = future.result()
         except Exception as e:
-            print(f"✗ Failed to create default header: {e}")
-            error_count += 1
+            for file_path in chunk:
+                print(f"✗ Error processing {file_path}: {e}")
+            error_count += len(chunk)
             continue
-    
-    if not license_path:
-        print(f"Info: No LICENSE file found, proceeding with header-only")
-    
-    try:
-        # Run addlicense with appropriate options
-        cmd = ['addlicense', '-f', header_path, '-v', file_path]
-        result = subprocess.run(cmd, capture_output=True, text=True, check=False)
-        
-        if result.returncode == 0:
-            print(f"✓ Successfully processed {file_path}")
-            success_count += 1
-        else:
-            print(f"✗ Failed to process {file_path}: {result.stderr.strip()}")
-            error_count += 1
-            
-    except Exception as e:
-        print(f"✗ Error processing {file_path}: {e}")
-        error_count += 1
-        continue
+
+        for file_path in chunk:
+            if file_path in failures:
+                print(f"✗ Failed to process {file_path}: {failures[file_path]}")
+                error_count += 1
+            else:
+                print(f"✓ Successfully processed {file_path}")
+                success_count += 1
 
 # Cleanup temporary header files
 for temp_header in temp_headers: